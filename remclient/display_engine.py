@@ -22,8 +22,9 @@ class BasicImageDisplay:
         self.images_dir = Path("/home/pi/images")
         self.images_dir.mkdir(exist_ok=True)
 
-        # Basic logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        # Last decoded image, keyed by (path, mtime) so unchanged files are not reloaded
+        self.current_image = None
+        self.current_image_key = None
 
     def load_image(self, image_path):
         """Load and scale image for display"""
@@ -41,7 +42,7 @@ class BasicImageDisplay:
 
             return image
         except Exception as e:
-            logging.error(f"Failed to load image {image_path}: {e}")
+            logging.error("Failed to load image %s: %s", image_path, e)
             return None
 
     def display_image(self, image):
@@ -60,7 +61,7 @@ class BasicImageDisplay:
         self.screen.blit(image, (x, y))
         pygame.display.flip()
 
-        logging.info(f"Displayed image: {img_width}x{img_height} at ({x}, {y})")
+        logging.info("Displayed image: %dx%d at (%d, %d)", img_width, img_height, x, y)
 
     def display_standby(self):
         """Display standby screen when no images available"""
@@ -71,7 +72,7 @@ class BasicImageDisplay:
     def run(self):
         """Main display loop"""
         logging.info("Starting Basic Image Display Engine")
-        logging.info(f"Display resolution: {self.display_width}x{self.display_height}")
+        logging.info("Display resolution: %dx%d", self.display_width, self.display_height)
 
         while True:
             try:
@@ -79,14 +80,19 @@ class BasicImageDisplay:
                 image_files = list(self.images_dir.glob("*.png")) + list(self.images_dir.glob("*.jpg"))
 
                 if image_files:
-                    # Sort by modification time (newest first)
-                    image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+                    # Display the most recent image (single pass, no full sort)
+                    latest_image = max(image_files, key=lambda x: x.stat().st_mtime)
+                    image_key = (latest_image, latest_image.stat().st_mtime)
+
+                    if image_key != self.current_image_key:
+                        logging.info("Loading image: %s", latest_image)
+                        image = self.load_image(latest_image)
+                        if image:
+                            self.current_image = image
+                            self.current_image_key = image_key
+                    else:
+                        image = self.current_image
 
-                    # Display the most recent image
-                    latest_image = image_files[0]
-                    logging.info(f"Loading image: {latest_image}")
-
-                    image = self.load_image(latest_image)
                     if image:
                         self.display_image(image)
 
@@ -118,12 +124,15 @@ class BasicImageDisplay:
                 logging.info("Display engine stopped by user")
                 break
             except Exception as e:
-                logging.error(f"Display engine error: {e}")
+                logging.error("Display engine error: %s", e)
                 time.sleep(5)  # Wait before retry
 
         pygame.quit()
 
 if __name__ == "__main__":
+    # Setup logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     display = BasicImageDisplay()
     try:
         display.run()
@@ -17,9 +17,6 @@ class BasicDisplayCapture:
         self.kiosk_url = kiosk_url
         self.output_dir.mkdir(exist_ok=True)
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
     def capture_display(self, display_id="default", width=1920, height=1080):
         """Capture current display as PNG image"""
         timestamp = int(time.time() * 1000)
@@ -69,17 +66,22 @@ class BasicDisplayCapture:
     def list_captured_images(self):
         """List all captured images"""
         image_files = list(self.output_dir.glob("*.png"))
-        image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # Stat each file once; reused for sorting and the listing below
+        stats = {img_file: img_file.stat() for img_file in image_files}
+        image_files.sort(key=lambda x: stats[x].st_mtime, reverse=True)
 
         logging.info(f"Found {len(image_files)} captured images:")
         for img_file in image_files[:10]:  # Show latest 10
-            mtime = time.ctime(img_file.stat().st_mtime)
-            size = img_file.stat().st_size
+            mtime = time.ctime(stats[img_file].st_mtime)
+            size = stats[img_file].st_size
             logging.info(f"  {img_file.name} - {size} bytes - {mtime}")
 
         return image_files
 
 if __name__ == "__main__":
+    # Setup logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     parser = argparse.ArgumentParser(description='Basic Display Capture System')
     parser.add_argument('--display-id', default='default', help='Display identifier')
     parser.add_argument('--output-dir', default='/var/lib/314sign/images', help='Output directory')
@@ -16,18 +16,17 @@ class BasicImageSync:
         self.images_dir = Path(images_dir)
         self.images_dir.mkdir(exist_ok=True)
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
     def list_available_images(self):
         """List all available images on kiosk"""
         image_files = list(self.images_dir.glob("*.png")) + list(self.images_dir.glob("*.jpg"))
-        image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # Stat each file once; reused for sorting and the listing below
+        stats = {img_file: img_file.stat() for img_file in image_files}
+        image_files.sort(key=lambda x: stats[x].st_mtime, reverse=True)
 
         logging.info(f"Available images in {self.images_dir}:")
         for i, img_file in enumerate(image_files[:10]):  # Show latest 10
-            mtime = time.ctime(img_file.stat().st_mtime)
-            size = img_file.stat().st_size
+            mtime = time.ctime(stats[img_file].st_mtime)
+            size = stats[img_file].st_size
             marker = " ← LATEST" if i == 0 else ""
             logging.info(f"  {img_file.name} - {size} bytes - {mtime}{marker}")
 
@@ -128,6 +127,9 @@ class BasicImageSync:
         return results
 
 if __name__ == "__main__":
+    # Setup logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     parser = argparse.ArgumentParser(description='Basic Image Synchronization')
     parser.add_argument('--images-dir', default='/var/lib/314sign/images', help='Local images directory')
     parser.add_argument('--device', help='Remote device hostname (e.g., remote-272ff1.local)')